@@ -4,29 +4,66 @@ Kachy Valkey Client
 High-performance Valkey client with automatic authentication and multi-tenancy support.
 """
 
-# Global client instance
+import threading
+
+# Global client instance, guarded by _client_lock in init()/close()
 _client = None
+_client_lock = threading.Lock()
+
+# Bound-method fast paths: each convenience function caches its client
+# method on first call, so steady-state kachy.get() is one function-object
+# indirection instead of get_client() plus an attribute lookup per call.
+_set = _get = _delete = _exists = _expire = _ttl = _valkey = None
+
+# Classes are exposed lazily so `import kachy` stays cheap; the HTTP
+# stack only loads once a client is actually constructed.
+_LAZY_CLASSES = {
+    "KachyClient": "client",
+    "KachyConfig": "config",
+    "KachyPipeline": "pipeline",
+    "AsyncKachyClient": "aio",
+}
+
+def __getattr__(name):
+    if name in _LAZY_CLASSES:
+        from importlib import import_module
+        return getattr(import_module(f".{_LAZY_CLASSES[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _reset_fast_paths():
+    """Drop cached bound methods so they re-bind to the current client."""
+    global _set, _get, _delete, _exists, _expire, _ttl, _valkey
+    _set = _get = _delete = _exists = _expire = _ttl = _valkey = None
 
 def init(access_key, **kwargs):
     """Initialize the Kachy client with your access key.
-    
+
     Args:
         access_key (str): Your KACHY_ACCESS_KEY for authentication
         **kwargs: Additional configuration options
     """
     global _client
     from .config import KachyConfig
-    from .client import KachyClient
     config = KachyConfig(access_key=access_key, **kwargs)
-    _client = KachyClient(config)
+    # Resolve through the module attribute so a patched kachy.KachyClient
+    # (e.g. in tests) is respected.
+    client_cls = globals().get("KachyClient")
+    if client_cls is None:
+        from .client import KachyClient as client_cls
+    with _client_lock:
+        _reset_fast_paths()
+        _client = client_cls(config)
+    # Best-effort pre-open of a pooled connection so the first real request
+    # doesn't pay DNS + TCP + TLS setup
+    _client._warmup()
     return _client
 
 def get_client():
     """Get the current Kachy client instance.
-    
+
     Returns:
         KachyClient: The initialized client instance
-        
+
     Raises:
         RuntimeError: If client is not initialized
     """
@@ -37,94 +74,120 @@ def get_client():
 # Convenience functions that delegate to the global client
 def set(key, value, ex=None):
     """Set a key-value pair with optional expiration.
-    
+
     Args:
         key (str): The key to set
         value (str): The value to store
         ex (int, optional): Expiration time in seconds
     """
-    return get_client().set(key, value, ex)
+    global _set
+    if _set is None:
+        _set = get_client().set
+    return _set(key, value, ex)
 
 def get(key):
     """Get a value by key.
-    
+
     Args:
         key (str): The key to retrieve
-        
+
     Returns:
         str: The stored value, or None if not found
     """
-    return get_client().get(key)
+    global _get
+    if _get is None:
+        _get = get_client().get
+    return _get(key)
 
 def delete(key):
     """Delete a key.
-    
+
     Args:
         key (str): The key to delete
-        
+
     Returns:
         bool: True if key was deleted, False if it didn't exist
     """
-    return get_client().delete(key)
+    global _delete
+    if _delete is None:
+        _delete = get_client().delete
+    return _delete(key)
 
 def exists(key):
     """Check if a key exists.
-    
+
     Args:
         key (str): The key to check
-        
+
     Returns:
         bool: True if key exists, False otherwise
     """
-    return get_client().exists(key)
+    global _exists
+    if _exists is None:
+        _exists = get_client().exists
+    return _exists(key)
 
 def expire(key, seconds):
     """Set expiration for a key.
-    
+
     Args:
         key (str): The key to set expiration for
         seconds (int): Expiration time in seconds
-        
+
     Returns:
         bool: True if expiration was set, False if key doesn't exist
     """
-    return get_client().expire(key, seconds)
+    global _expire
+    if _expire is None:
+        _expire = get_client().expire
+    return _expire(key, seconds)
 
 def ttl(key):
     """Get time to live for a key.
-    
+
     Args:
         key (str): The key to check
-        
+
     Returns:
         int: Time to live in seconds, -1 if no expiration, -2 if key doesn't exist
     """
-    return get_client().ttl(key)
+    global _ttl
+    if _ttl is None:
+        _ttl = get_client().ttl
+    return _ttl(key)
 
 def valkey(command, *args):
     """Execute any Valkey command.
-    
+
     Args:
         command (str): The Valkey command to execute
         *args: Arguments for the command
-        
+
     Returns:
         The result of the Valkey command
     """
-    return get_client().valkey(command, *args)
+    global _valkey
+    if _valkey is None:
+        _valkey = get_client().valkey
+    return _valkey(command, *args)
 
 def pipeline():
     """Create a pipeline for batch operations.
-    
+
     Returns:
         KachyPipeline: A pipeline object for batch operations
     """
     return get_client().pipeline()
 
 def close():
-    """Close the connection."""
-    if _client:
-        _client.close()
+    """Close the connection and forget the global client."""
+    global _client
+    with _client_lock:
+        client = _client
+        _client = None
+        _reset_fast_paths()
+    if client is not None:
+        client.close()
 
 # Export main classes - these will be available after import
 __all__ = [
@@ -0,0 +1,219 @@
+"""
+Async client module for Kachy Redis.
+"""
+
+import gzip
+from typing import Any, Optional, Dict
+from urllib.parse import quote
+
+from .config import KachyConfig
+from .client import (
+    KachyAuthenticationError,
+    KachyConnectionError,
+    KachyResponseError,
+    _GZIP_MIN_BYTES,
+    _json_dumps,
+    _json_loads,
+)
+
+
+class AsyncKachyClient:
+    """Async client for interacting with Kachy Redis.
+
+    Mirrors KachyClient, but issues requests through httpx.AsyncClient so a
+    single task can keep many requests in flight over the keep-alive pool::
+
+        async with AsyncKachyClient(config) as client:
+            values = await asyncio.gather(*(client.get(k) for k in keys))
+
+    Requires the optional httpx dependency (install with
+    ``kachy-valkey[async]``).
+    """
+
+    def __init__(self, config: KachyConfig):
+        """Initialize the async Kachy client.
+
+        Args:
+            config: Configuration object
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "AsyncKachyClient requires httpx; install with kachy-valkey[async]"
+            )
+
+        self.config = config
+        self._headers = {**config.headers, "Authorization": f"Bearer {config.access_key}"}
+        base = config.base_url
+        self._url_set = base + "/valkey/set"
+        self._url_get = base + "/valkey/get/"
+        self._url_del = base + "/valkey/del/"
+        self._url_exists = base + "/valkey/exists/"
+        self._url_expire = base + "/valkey/expire"
+        self._url_ttl = base + "/valkey/ttl/"
+        self._url_exec = base + "/valkey/exec"
+        self._url_pipeline = base + "/valkey/pipeline"
+        self._httpx = httpx
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=config.pool_size,
+                max_connections=config.pool_size
+            ),
+            timeout=httpx.Timeout(
+                config.read_timeout,
+                connect=config.connect_timeout
+            ),
+            transport=httpx.AsyncHTTPTransport(http2=config.http2, retries=config.max_retries)
+        )
+
+    async def _make_request(self, method: str, url: str, data: Optional[Dict] = None) -> Any:
+        """Make an HTTP request to the Kachy API.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            data: Request data
+
+        Returns:
+            API response data
+
+        Raises:
+            KachyConnectionError: For connection issues
+            KachyAuthenticationError: For authentication issues
+            KachyResponseError: For API errors
+        """
+        body = _json_dumps(data) if data is not None else None
+        headers = self._headers
+        if body is not None and len(body) > _GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers = {**headers, "Content-Encoding": "gzip"}
+
+        try:
+            response = await self._client.request(
+                method,
+                url,
+                content=body,
+                headers=headers
+            )
+        except self._httpx.HTTPError as e:
+            raise KachyConnectionError(f"Request failed: {e}")
+
+        if response.status_code == 401:
+            raise KachyAuthenticationError("Authentication failed")
+        elif response.status_code >= 400:
+            raise KachyResponseError(f"API error {response.status_code}: {response.text}")
+
+        if response.headers.get("Content-Length") == "0":
+            return None
+        return _json_loads(response.content) if response.content else None
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
+        """Set a key-value pair with optional expiration.
+
+        Args:
+            key: The key to set
+            value: The value to store
+            ex: Expiration time in seconds
+
+        Returns:
+            True if successful
+        """
+        data = {"key": key, "value": value}
+        if ex is not None:
+            data["ex"] = ex
+
+        result = await self._make_request("POST", self._url_set, data)
+        return result.get("success", False)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a value by key.
+
+        Args:
+            key: The key to retrieve
+
+        Returns:
+            The stored value, or None if not found
+        """
+        result = await self._make_request("GET", self._url_get + quote(key, safe=""))
+        return result.get("value")
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key.
+
+        Args:
+            key: The key to delete
+
+        Returns:
+            True if key was deleted, False if it didn't exist
+        """
+        result = await self._make_request("DELETE", self._url_del + quote(key, safe=""))
+        return result.get("deleted", False)
+
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists.
+
+        Args:
+            key: The key to check
+
+        Returns:
+            True if key exists, False otherwise
+        """
+        result = await self._make_request("GET", self._url_exists + quote(key, safe=""))
+        return result.get("exists", False)
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        """Set expiration for a key.
+
+        Args:
+            key: The key to set expiration for
+            seconds: Expiration time in seconds
+
+        Returns:
+            True if expiration was set, False if key doesn't exist
+        """
+        data = {"key": key, "seconds": seconds}
+        result = await self._make_request("POST", self._url_expire, data)
+        return result.get("success", False)
+
+    async def ttl(self, key: str) -> int:
+        """Get time to live for a key.
+
+        Args:
+            key: The key to check
+
+        Returns:
+            Time to live in seconds, -1 if no expiration, -2 if key doesn't exist
+        """
+        result = await self._make_request("GET", self._url_ttl + quote(key, safe=""))
+        return result.get("ttl", -2)
+
+    async def redis(self, command: str, *args) -> Any:
+        """Execute any Redis command.
+
+        Args:
+            command: The Redis command to execute
+            *args: Arguments for the command
+
+        Returns:
+            The result of the Redis command
+        """
+        data = {
+            "command": command.upper(),
+            "args": list(args)
+        }
+
+        result = await self._make_request("POST", self._url_exec, data)
+        return result.get("result")
+
+    async def close(self):
+        """Close the connection and cleanup resources."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -2,15 +2,42 @@
 Main client module for Kachy Redis.
 """
 
-import json
-import time
-import requests
-from typing import Any, Optional, Dict, List, Union
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import gzip
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Optional, Dict, TYPE_CHECKING
+from urllib.parse import quote
 
 from .config import KachyConfig
-from .pipeline import KachyPipeline
+
+if TYPE_CHECKING:
+    import urllib3
+    from .pipeline import KachyPipeline
+
+# Prefer orjson for JSON encode/decode when available (install with
+# kachy-valkey[speedups]); fall back to the stdlib otherwise.
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    import json as _json
+
+    def _json_dumps(obj):
+        return _json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = _json.loads
+
+# urllib3 renamed Retry's method_whitelist to allowed_methods; detected on
+# first pool creation so retries are not silently disabled on either side
+# of the rename.
+_RETRY_METHODS_KWARG = None
+
+# Set on first pool creation so the request hot path needs no import.
+_HTTP_ERROR = None
+
+# Request bodies above this size are gzip-compressed on the wire; mostly
+# large pipeline payloads, whose repetitive JSON compresses 5-10x.
+_GZIP_MIN_BYTES = 1024
 
 
 class KachyError(Exception):
@@ -35,7 +62,14 @@ class KachyResponseError(KachyError):
 
 class KachyClient:
     """Main client for interacting with Kachy Redis."""
-    
+
+    __slots__ = (
+        "config", "pool", "_http2_client", "_httpx", "_headers", "_timeout",
+        "_url_set", "_url_setex", "_url_get", "_url_del", "_url_exists",
+        "_url_expire", "_url_ttl", "_url_exec", "_url_pipeline",
+        "_autopipe", "_cache", "_cache_lock"
+    )
+
     def __init__(self, config: KachyConfig):
         """Initialize the Kachy client.
         
@@ -43,36 +77,108 @@ class KachyClient:
             config: Configuration object
         """
         self.config = config
-        self.session = self._create_session()
+        # The access key is fixed for the client's lifetime, so build the
+        # Authorization-bearing headers once instead of per request.
+        self._headers = {**config.headers, "Authorization": f"Bearer {config.access_key}"}
+        # Per-route URL prefixes, built once; per-key routes only need the
+        # (percent-encoded) key appended per call.
+        base = config.base_url
+        self._url_set = base + "/valkey/set"
+        self._url_setex = base + "/valkey/setex"
+        self._url_get = base + "/valkey/get/"
+        self._url_del = base + "/valkey/del/"
+        self._url_exists = base + "/valkey/exists/"
+        self._url_expire = base + "/valkey/expire"
+        self._url_ttl = base + "/valkey/ttl/"
+        self._url_exec = base + "/valkey/exec"
+        self._url_pipeline = base + "/valkey/pipeline"
+        if config.http2:
+            self.pool = None
+            self._http2_client = self._create_http2_client()
+        else:
+            self.pool = self._create_pool()
+            self._http2_client = None
+        self._autopipe = None
+        # Optional short-TTL read cache (see KachyConfig.client_cache_size);
+        # folds bursts of repeated reads into one round-trip
+        if config.client_cache_size > 0:
+            self._cache = OrderedDict()
+            self._cache_lock = threading.Lock()
+        else:
+            self._cache = None
     
-    def _create_session(self) -> requests.Session:
-        """Create and configure the requests session."""
-        session = requests.Session()
-        
+    def _create_pool(self) -> "urllib3.PoolManager":
+        """Create and configure the urllib3 connection pool."""
+        global _RETRY_METHODS_KWARG, _HTTP_ERROR
+        import urllib3
+        from urllib3.util.retry import Retry
+
+        _HTTP_ERROR = urllib3.exceptions.HTTPError
+
+        if _RETRY_METHODS_KWARG is None:
+            try:
+                Retry(allowed_methods=frozenset())
+                _RETRY_METHODS_KWARG = "allowed_methods"
+            except TypeError:
+                _RETRY_METHODS_KWARG = "method_whitelist"
+
         # Configure retry strategy
         retry_strategy = Retry(
             total=self.config.max_retries,
             status_forcelist=[429, 500, 502, 503, 504],
-            method_whitelist=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
-            backoff_factor=self.config.retry_delay
+            backoff_factor=self.config.retry_delay,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            **{_RETRY_METHODS_KWARG: frozenset(["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"])}
+        )
+
+        # Separate connect/read budgets: a stalled handshake fails fast and
+        # lets Retry move on, without shortening in-flight reads
+        self._timeout = urllib3.Timeout(
+            connect=self.config.connect_timeout,
+            read=self.config.read_timeout
+        )
+
+        # One host, so one pool; talking to urllib3 directly skips the
+        # PreparedRequest/cookie/hook machinery requests runs per call.
+        return urllib3.PoolManager(
+            num_pools=1,
+            maxsize=self.config.pool_size,
+            block=False,
+            retries=retry_strategy
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=self.config.pool_size)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        return session
-    
-    def _get_auth_token(self) -> str:
-        """Get the access key for authentication."""
-        return self.config.access_key
     
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Any:
+    def _create_http2_client(self):
+        """Create an httpx client multiplexing requests over one HTTP/2 connection."""
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "KachyConfig(http2=True) requires httpx with h2; install with kachy-valkey[http2]"
+            )
+
+        self._httpx = httpx
+        return httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=self.config.max_retries,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.config.pool_size,
+                    max_connections=self.config.pool_size
+                )
+            ),
+            timeout=httpx.Timeout(
+                self.config.read_timeout,
+                connect=self.config.connect_timeout
+            )
+        )
+
+    def _make_request(self, method: str, url: str, data: Optional[Dict] = None) -> Any:
         """Make an HTTP request to the Kachy API.
-        
+
         Args:
             method: HTTP method
-            endpoint: API endpoint
+            url: Full request URL
             data: Request data
             
         Returns:
@@ -83,29 +189,132 @@ class KachyClient:
             KachyAuthenticationError: For authentication issues
             KachyResponseError: For API errors
         """
-        url = f"{self.config.base_url}{endpoint}"
-        headers = self.config.headers.copy()
-        headers["Authorization"] = f"Bearer {self._get_auth_token()}"
-        
+        body = _json_dumps(data) if data is not None else None
+        headers = self._headers
+        if body is not None and len(body) > _GZIP_MIN_BYTES:
+            # Level 1 keeps CPU negligible next to the bytes saved on the wire
+            body = gzip.compress(body, compresslevel=1)
+            headers = {**headers, "Content-Encoding": "gzip"}
+
+        if self._http2_client is not None:
+            return self._make_request_http2(method, url, body, headers)
+
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
+            response = self.pool.request(
+                method,
+                url,
+                body=body,
                 headers=headers,
-                json=data,
-                timeout=self.config.timeout
+                timeout=self._timeout
             )
-            
-            if response.status_code == 401:
-                raise KachyAuthenticationError("Authentication failed")
-            elif response.status_code >= 400:
-                raise KachyResponseError(f"API error {response.status_code}: {response.text}")
-            
-            return response.json() if response.content else None
-            
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERROR as e:
             raise KachyConnectionError(f"Request failed: {e}")
-    
+
+        if response.status == 401:
+            raise KachyAuthenticationError("Authentication failed")
+        elif response.status >= 400:
+            raise KachyResponseError(
+                f"API error {response.status}: {response.data.decode('utf-8', 'replace')}"
+            )
+
+        # Empty responses (e.g. 204s) need no body handling at all
+        if response.headers.get("Content-Length") == "0":
+            return None
+        return _json_loads(response.data) if response.data else None
+
+    def _make_request_http2(self, method: str, url: str, body: Optional[bytes],
+                            headers: Dict[str, str]) -> Any:
+        """Make an HTTP request over the multiplexed HTTP/2 transport."""
+        try:
+            response = self._http2_client.request(
+                method,
+                url,
+                content=body,
+                headers=headers
+            )
+        except self._httpx.HTTPError as e:
+            raise KachyConnectionError(f"Request failed: {e}")
+
+        if response.status_code == 401:
+            raise KachyAuthenticationError("Authentication failed")
+        elif response.status_code >= 400:
+            raise KachyResponseError(f"API error {response.status_code}: {response.text}")
+
+        if response.headers.get("Content-Length") == "0":
+            return None
+        return _json_loads(response.content) if response.content else None
+
+    def _cache_get(self, kind: str, key: str) -> Optional[tuple]:
+        """Look up a fresh cached read result.
+
+        Returns:
+            A (value,) tuple on a hit (so cached None values are
+            distinguishable from a miss), or None on a miss.
+        """
+        with self._cache_lock:
+            entry = self._cache.get((kind, key))
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < monotonic():
+                del self._cache[(kind, key)]
+                return None
+            self._cache.move_to_end((kind, key))
+            return (value,)
+
+    def _cache_put(self, kind: str, key: str, value: Any):
+        """Cache a read result, evicting least-recently-used entries."""
+        with self._cache_lock:
+            self._cache[(kind, key)] = (value, monotonic() + self.config.client_cache_ttl)
+            self._cache.move_to_end((kind, key))
+            while len(self._cache) > self.config.client_cache_size:
+                self._cache.popitem(last=False)
+
+    def _cache_invalidate(self, key: str):
+        """Drop any cached read results for a written key."""
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            for kind in ("get", "exists", "ttl"):
+                self._cache.pop((kind, key), None)
+
+    def _warmup(self):
+        """Pre-open a pooled connection so the first real request skips the handshake.
+
+        Best-effort: any failure is ignored and the first real request
+        simply connects as before.
+        """
+        url = self.config.base_url + "/healthz"
+        try:
+            if self._http2_client is not None:
+                self._http2_client.request("HEAD", url, headers=self._headers)
+            else:
+                self.pool.request("HEAD", url, headers=self._headers, timeout=2, retries=False)
+        except Exception:
+            pass
+
+    def enable_autopipeline(self, max_batch: int = 256, max_delay_us: int = 200):
+        """Enable implicit command batching.
+
+        While enabled, set/get/delete/exists/expire/ttl calls issued within
+        a short window are coalesced into a single `/valkey/pipeline` POST
+        instead of one HTTP request each. Calls still block until their
+        result is available.
+
+        Args:
+            max_batch: Maximum commands per batched request
+            max_delay_us: Maximum microseconds a call may wait to be batched
+        """
+        if self._autopipe is None:
+            from .pipeline import _AutoPipeline
+            self._autopipe = _AutoPipeline(self, max_batch=max_batch, max_delay_us=max_delay_us)
+
+    def disable_autopipeline(self):
+        """Disable implicit command batching, draining any queued commands."""
+        if self._autopipe is not None:
+            self._autopipe.close()
+            self._autopipe = None
+
     def set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
         """Set a key-value pair with optional expiration.
         
@@ -117,12 +326,22 @@ class KachyClient:
         Returns:
             True if successful
         """
-        data = {"key": key, "value": value}
-        if ex is not None:
-            data["ex"] = ex
-        
-        result = self._make_request("POST", "/valkey/set", data)
-        return result.get("success", False)
+        # Commit to SET vs SETEX here instead of making the server branch on
+        # an optional ex field
+        if self._autopipe is not None:
+            if ex is None:
+                success = bool(self._autopipe.submit("SET", [key, value]).result())
+            else:
+                success = bool(self._autopipe.submit("SETEX", [key, ex, value]).result())
+        elif ex is None:
+            result = self._make_request("POST", self._url_set, {"key": key, "value": value})
+            success = result.get("success", False)
+        else:
+            result = self._make_request("POST", self._url_setex, {"key": key, "value": value, "ex": ex})
+            success = result.get("success", False)
+
+        self._cache_invalidate(key)
+        return success
     
     def get(self, key: str) -> Optional[str]:
         """Get a value by key.
@@ -133,8 +352,20 @@ class KachyClient:
         Returns:
             The stored value, or None if not found
         """
-        result = self._make_request("GET", f"/valkey/get/{key}")
-        return result.get("value")
+        if self._cache is not None:
+            hit = self._cache_get("get", key)
+            if hit is not None:
+                return hit[0]
+
+        if self._autopipe is not None:
+            value = self._autopipe.submit("GET", [key]).result()
+        else:
+            result = self._make_request("GET", self._url_get + quote(key, safe=""))
+            value = result.get("value")
+
+        if self._cache is not None:
+            self._cache_put("get", key, value)
+        return value
     
     def delete(self, key: str) -> bool:
         """Delete a key.
@@ -145,8 +376,14 @@ class KachyClient:
         Returns:
             True if key was deleted, False if it didn't exist
         """
-        result = self._make_request("DELETE", f"/valkey/del/{key}")
-        return result.get("deleted", False)
+        if self._autopipe is not None:
+            deleted = bool(self._autopipe.submit("DEL", [key]).result())
+        else:
+            result = self._make_request("DELETE", self._url_del + quote(key, safe=""))
+            deleted = result.get("deleted", False)
+
+        self._cache_invalidate(key)
+        return deleted
     
     def exists(self, key: str) -> bool:
         """Check if a key exists.
@@ -157,8 +394,20 @@ class KachyClient:
         Returns:
             True if key exists, False otherwise
         """
-        result = self._make_request("GET", f"/valkey/exists/{key}")
-        return result.get("exists", False)
+        if self._cache is not None:
+            hit = self._cache_get("exists", key)
+            if hit is not None:
+                return hit[0]
+
+        if self._autopipe is not None:
+            exists = bool(self._autopipe.submit("EXISTS", [key]).result())
+        else:
+            result = self._make_request("GET", self._url_exists + quote(key, safe=""))
+            exists = result.get("exists", False)
+
+        if self._cache is not None:
+            self._cache_put("exists", key, exists)
+        return exists
     
     def expire(self, key: str, seconds: int) -> bool:
         """Set expiration for a key.
@@ -170,9 +419,15 @@ class KachyClient:
         Returns:
             True if expiration was set, False if key doesn't exist
         """
-        data = {"key": key, "seconds": seconds}
-        result = self._make_request("POST", "/valkey/expire", data)
-        return result.get("success", False)
+        if self._autopipe is not None:
+            success = bool(self._autopipe.submit("EXPIRE", [key, seconds]).result())
+        else:
+            data = {"key": key, "seconds": seconds}
+            result = self._make_request("POST", self._url_expire, data)
+            success = result.get("success", False)
+
+        self._cache_invalidate(key)
+        return success
     
     def ttl(self, key: str) -> int:
         """Get time to live for a key.
@@ -183,8 +438,21 @@ class KachyClient:
         Returns:
             Time to live in seconds, -1 if no expiration, -2 if key doesn't exist
         """
-        result = self._make_request("GET", f"/valkey/ttl/{key}")
-        return result.get("ttl", -2)
+        if self._cache is not None:
+            hit = self._cache_get("ttl", key)
+            if hit is not None:
+                return hit[0]
+
+        if self._autopipe is not None:
+            result = self._autopipe.submit("TTL", [key]).result()
+            ttl = result if result is not None else -2
+        else:
+            result = self._make_request("GET", self._url_ttl + quote(key, safe=""))
+            ttl = result.get("ttl", -2)
+
+        if self._cache is not None:
+            self._cache_put("ttl", key, ttl)
+        return ttl
     
     def redis(self, command: str, *args) -> Any:
         """Execute any Redis command.
@@ -201,21 +469,28 @@ class KachyClient:
             "args": list(args)
         }
         
-        result = self._make_request("POST", "/valkey/exec", data)
+        result = self._make_request("POST", self._url_exec, data)
         return result.get("result")
     
-    def pipeline(self) -> "KachyPipeline":
+    def pipeline(self, initial_capacity: int = 0) -> "KachyPipeline":
         """Create a pipeline for batch operations.
-        
+
+        Args:
+            initial_capacity: Hint for the expected number of queued commands
+
         Returns:
             A pipeline object for batch operations
         """
-        return KachyPipeline(self)
+        from .pipeline import KachyPipeline
+        return KachyPipeline(self, initial_capacity=initial_capacity)
     
     def close(self):
         """Close the connection and cleanup resources."""
-        if self.session:
-            self.session.close()
+        self.disable_autopipeline()
+        if self.pool is not None:
+            self.pool.clear()
+        if self._http2_client is not None:
+            self._http2_client.close()
     
     def __enter__(self):
         """Context manager entry."""
@@ -3,37 +3,61 @@ Configuration module for Kachy Redis client.
 """
 
 import os
-from typing import Optional, Dict, Any
+import sys
+from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
+_DEFAULT_USER_AGENT = "kachy-valkey-python/0.1.0"
 
-@dataclass
+
+def _default_headers() -> Dict[str, str]:
+    """Build the default request headers."""
+    return {
+        "User-Agent": _DEFAULT_USER_AGENT,
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "Connection": "keep-alive"
+    }
+
+
+# dataclass slots arrived in Python 3.10; older interpreters get a plain
+# frozen dataclass.
+_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_KWARGS)
 class KachyConfig:
-    """Configuration for the Kachy Redis client."""
-    
+    """Immutable configuration for the Kachy Redis client."""
+
     access_key: str
     base_url: str = field(default_factory=lambda: os.environ.get("KACHY_BASE_URL", "https://api.klache.net"))
     timeout: int = field(default_factory=lambda: int(os.environ.get("KACHY_TIMEOUT", "30")))
+    connect_timeout: float = field(default_factory=lambda: float(os.environ.get("KACHY_CONNECT_TIMEOUT", "1.0")))
+    read_timeout: Optional[float] = field(default_factory=lambda: float(os.environ["KACHY_READ_TIMEOUT"]) if "KACHY_READ_TIMEOUT" in os.environ else None)
     max_retries: int = field(default_factory=lambda: int(os.environ.get("KACHY_MAX_RETRIES", "3")))
     retry_delay: float = field(default_factory=lambda: float(os.environ.get("KACHY_RETRY_DELAY", "1.0")))
     pool_size: int = field(default_factory=lambda: int(os.environ.get("KACHY_POOL_SIZE", "10")))
-    user_agent: str = field(default="kachy-valkey-python/0.1.0")
-    
+    http2: bool = field(default_factory=lambda: os.environ.get("KACHY_HTTP2", "false").lower() in ("1", "true", "yes"))
+    client_cache_size: int = field(default_factory=lambda: int(os.environ.get("KACHY_CLIENT_CACHE_SIZE", "0")))
+    client_cache_ttl: float = field(default_factory=lambda: float(os.environ.get("KACHY_CLIENT_CACHE_TTL", "0.05")))
+    user_agent: str = field(default=_DEFAULT_USER_AGENT)
+
     # Request headers
-    headers: Dict[str, str] = field(default_factory=dict)
-    
+    headers: Dict[str, str] = field(default_factory=_default_headers)
+
     def __post_init__(self):
-        """Validate and set default values after initialization."""
+        """Validate configuration after initialization."""
         if not self.access_key:
             raise ValueError("KACHY_ACCESS_KEY is required")
-        
-        # Set default headers
-        if not self.headers:
-            self.headers = {
-                "User-Agent": self.user_agent,
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
+
+        # Reads default to the overall budget; connects stay short so a
+        # stalled handshake fails over quickly
+        if self.read_timeout is None:
+            object.__setattr__(self, "read_timeout", float(self.timeout))
+
+        # Keep a custom user_agent visible in the default headers
+        if self.user_agent != _DEFAULT_USER_AGENT and self.headers.get("User-Agent") == _DEFAULT_USER_AGENT:
+            object.__setattr__(self, "headers", {**self.headers, "User-Agent": self.user_agent})
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
@@ -41,9 +65,14 @@ class KachyConfig:
             "access_key": self.access_key,
             "base_url": self.base_url,
             "timeout": self.timeout,
+            "connect_timeout": self.connect_timeout,
+            "read_timeout": self.read_timeout,
             "max_retries": self.max_retries,
             "retry_delay": self.retry_delay,
             "pool_size": self.pool_size,
+            "http2": self.http2,
+            "client_cache_size": self.client_cache_size,
+            "client_cache_ttl": self.client_cache_ttl,
             "user_agent": self.user_agent,
             "headers": self.headers.copy()
         }
@@ -57,5 +86,6 @@ class KachyConfig:
             timeout=int(os.environ.get("KACHY_TIMEOUT", "30")),
             max_retries=int(os.environ.get("KACHY_MAX_RETRIES", "3")),
             retry_delay=float(os.environ.get("KACHY_RETRY_DELAY", "1.0")),
-            pool_size=int(os.environ.get("KACHY_POOL_SIZE", "10"))
+            pool_size=int(os.environ.get("KACHY_POOL_SIZE", "10")),
+            http2=os.environ.get("KACHY_HTTP2", "false").lower() in ("1", "true", "yes")
         )
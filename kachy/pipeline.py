@@ -2,21 +2,135 @@
 Pipeline module for batch Redis operations.
 """
 
-from typing import List, Any, Optional
-from .client import KachyClient
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import List, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import KachyClient
+
+# Interned command and JSON-key strings: every queued command shares one
+# string object per literal, which also speeds up encoder key handling at
+# 10k-command scale.
+_COMMAND = sys.intern("command")
+_ARGS = sys.intern("args")
+_SET = sys.intern("SET")
+_SETEX = sys.intern("SETEX")
+_GET = sys.intern("GET")
+_DEL = sys.intern("DEL")
+_EXISTS = sys.intern("EXISTS")
+_EXPIRE = sys.intern("EXPIRE")
+_TTL = sys.intern("TTL")
+
+
+class _AutoPipeline:
+    """Background coalescer that batches commands into single pipeline POSTs.
+
+    Commands submitted from any thread are queued and flushed by a worker
+    thread as one `/valkey/pipeline` request whenever the queue reaches
+    `max_batch` entries or the oldest entry has waited `max_delay_us`
+    microseconds, so N concurrent calls share one round-trip.
+    """
+
+    def __init__(self, client: "KachyClient", max_batch: int = 256, max_delay_us: int = 200):
+        """Initialize the auto-pipeline.
+
+        Args:
+            client: The Kachy client instance
+            max_batch: Maximum commands per flush
+            max_delay_us: Maximum microseconds a command may wait in the queue
+        """
+        self.client = client
+        self.max_batch = max_batch
+        self.max_delay = max_delay_us / 1_000_000
+        self._queue = deque()
+        self._wake = threading.Condition(threading.Lock())
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="kachy-autopipeline", daemon=True)
+        self._worker.start()
+
+    def submit(self, command: str, args: List[Any]) -> "Future":
+        """Queue a command and return a Future resolving to its result.
+
+        Args:
+            command: The command name (e.g. "SET")
+            args: Arguments for the command
+
+        Returns:
+            Future that resolves to the command's result
+        """
+        future = Future()
+        with self._wake:
+            if self._closed:
+                raise RuntimeError("Auto-pipeline is closed")
+            self._queue.append(({_COMMAND: command, _ARGS: args}, future))
+            self._wake.notify()
+        return future
+
+    def close(self):
+        """Stop the worker after draining any queued commands."""
+        with self._wake:
+            if self._closed:
+                return
+            self._closed = True
+            self._wake.notify()
+        self._worker.join()
+
+    def _run(self):
+        """Worker loop: wait for commands, coalesce, flush."""
+        while True:
+            with self._wake:
+                while not self._queue and not self._closed:
+                    self._wake.wait()
+                if not self._queue and self._closed:
+                    return
+                # Give callers a short window to pile on before flushing
+                if len(self._queue) < self.max_batch and not self._closed:
+                    self._wake.wait(self.max_delay)
+                batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.max_batch))]
+            self._flush(batch)
+
+    def _flush(self, batch):
+        """Send one batch and fan results back out to the waiting futures."""
+        data = {"commands": [command for command, _ in batch]}
+        try:
+            result = self.client._make_request("POST", self.client._url_pipeline, data)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        results = result.get("results", []) if result else []
+        for i, (_, future) in enumerate(batch):
+            future.set_result(results[i] if i < len(results) else None)
 
 
 class KachyPipeline:
     """Pipeline for batch Redis operations."""
-    
-    def __init__(self, client: KachyClient):
+
+    __slots__ = ("client", "commands", "_append")
+
+    def __init__(self, client: "KachyClient", initial_capacity: int = 0):
         """Initialize the pipeline.
-        
+
         Args:
             client: The Kachy client instance
+            initial_capacity: Hint for the expected number of queued
+                commands; pre-grows the command list's backing storage so
+                bulk loads skip the incremental reallocations
         """
         self.client = client
         self.commands = []
+        if initial_capacity > 0:
+            # Grow then empty in place; the list object (and the _append
+            # binding below) stays the same
+            self.commands.extend([None] * initial_capacity)
+            del self.commands[:]
+        # Bind append once; skips an attribute lookup per queued command,
+        # which adds up at 10k+ command pipelines
+        self._append = self.commands.append
     
     def set(self, key: str, value: str, ex: Optional[int] = None) -> "KachyPipeline":
         """Add SET command to pipeline.
@@ -29,7 +143,10 @@ class KachyPipeline:
         Returns:
             Self for method chaining
         """
-        self.commands.append(("SET", key, value, ex))
+        if ex is None:
+            self._append({_COMMAND: _SET, _ARGS: [key, value]})
+        else:
+            self._append({_COMMAND: _SETEX, _ARGS: [key, ex, value]})
         return self
     
     def get(self, key: str) -> "KachyPipeline":
@@ -41,7 +158,7 @@ class KachyPipeline:
         Returns:
             Self for method chaining
         """
-        self.commands.append(("GET", key))
+        self._append({_COMMAND: _GET, _ARGS: [key]})
         return self
     
     def delete(self, key: str) -> "KachyPipeline":
@@ -53,7 +170,7 @@ class KachyPipeline:
         Returns:
             Self for method chaining
         """
-        self.commands.append(("DEL", key))
+        self._append({_COMMAND: _DEL, _ARGS: [key]})
         return self
     
     def exists(self, key: str) -> "KachyPipeline":
@@ -65,7 +182,7 @@ class KachyPipeline:
         Returns:
             Self for method chaining
         """
-        self.commands.append(("EXISTS", key))
+        self._append({_COMMAND: _EXISTS, _ARGS: [key]})
         return self
     
     def expire(self, key: str, seconds: int) -> "KachyPipeline":
@@ -78,7 +195,7 @@ class KachyPipeline:
         Returns:
             Self for method chaining
         """
-        self.commands.append(("EXPIRE", key, seconds))
+        self._append({_COMMAND: _EXPIRE, _ARGS: [key, seconds]})
         return self
     
     def ttl(self, key: str) -> "KachyPipeline":
@@ -90,7 +207,7 @@ class KachyPipeline:
         Returns:
             Self for method chaining
         """
-        self.commands.append(("TTL", key))
+        self._append({_COMMAND: _TTL, _ARGS: [key]})
         return self
     
     def redis(self, command: str, *args) -> "KachyPipeline":
@@ -103,7 +220,7 @@ class KachyPipeline:
         Returns:
             Self for method chaining
         """
-        self.commands.append((command.upper(),) + args)
+        self._append({_COMMAND: sys.intern(command.upper()), _ARGS: list(args)})
         return self
     
     def execute(self) -> List[Any]:
@@ -119,28 +236,26 @@ class KachyPipeline:
             return []
         
         try:
-            # Execute all commands in a single batch request
-            data = {
-                "commands": [
-                    {
-                        "command": cmd[0],
-                        "args": list(cmd[1:])
-                    }
-                    for cmd in self.commands
-                ]
-            }
-            
-            result = self.client._make_request("POST", "/valkey/pipeline", data)
+            # Commands are already stored in wire shape
+            data = {"commands": self.commands}
+
+            result = self.client._make_request("POST", self.client._url_pipeline, data)
             results = result.get("results", [])
-            
-            # Clear commands after execution
-            self.commands.clear()
+
+            # Drop cached reads for any keys this pipeline wrote
+            if self.client._cache is not None:
+                for cmd in self.commands:
+                    if cmd[_COMMAND] in (_SET, _SETEX, _DEL, _EXPIRE):
+                        self.client._cache_invalidate(cmd[_ARGS][0])
+
+            # Empty in place so the list object and its append binding survive
+            del self.commands[:]
             
             return results
             
         except Exception as e:
             # Clear commands on error
-            self.commands.clear()
+            del self.commands[:]
             raise e
     
     def __enter__(self):
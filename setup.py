@@ -28,9 +28,18 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[
-        "requests>=2.25.0",
+        "urllib3>=1.26.0",
     ],
     extras_require={
+        "speedups": [
+            "orjson>=3.6",
+        ],
+        "async": [
+            "httpx>=0.23",
+        ],
+        "http2": [
+            "httpx[http2]>=0.23",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
@@ -139,5 +139,179 @@ class TestKachyClient(unittest.TestCase):
             kachy.get_client()
 
 
+class TestAutoPipeline(unittest.TestCase):
+    """Test cases for the auto-pipelining layer."""
+
+    def setUp(self):
+        """Set up a real client with the HTTP layer mocked out."""
+        from kachy.config import KachyConfig
+        from kachy.client import KachyClient
+
+        self.client = KachyClient(KachyConfig(access_key='test-secret'))
+        # KachyClient is slotted, so patch at class level
+        patcher = patch.object(KachyClient, '_make_request')
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.client.close()
+
+    def test_autopipeline_batches_commands(self):
+        """Test that concurrent commands share one pipeline request."""
+        import threading
+
+        started = threading.Event()
+
+        def slow_request(method, endpoint, data=None):
+            started.set()
+            return {"results": [True] * len(data["commands"])}
+
+        self.mock_request.side_effect = slow_request
+        # Large delay window so both submissions land in the same batch
+        self.client.enable_autopipeline(max_delay_us=50000)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.client.set('k1', 'v1'))),
+            threading.Thread(target=lambda: results.append(self.client.exists('k2'))),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(results, [True, True])
+        self.assertEqual(self.mock_request.call_count, 1)
+        method, url, data = self.mock_request.call_args[0]
+        self.assertEqual(url, self.client._url_pipeline)
+        self.assertEqual(len(data['commands']), 2)
+
+    def test_autopipeline_propagates_errors(self):
+        """Test that request failures surface on the waiting caller."""
+        from kachy.client import KachyConnectionError
+
+        self.mock_request.side_effect = KachyConnectionError('boom')
+        self.client.enable_autopipeline()
+
+        with self.assertRaises(KachyConnectionError):
+            self.client.get('test-key')
+
+    def test_disable_autopipeline_restores_direct_requests(self):
+        """Test that disabling the auto-pipeline goes back to per-call requests."""
+        self.mock_request.return_value = {"value": "test-value"}
+        self.client.enable_autopipeline()
+        self.client.disable_autopipeline()
+
+        result = self.client.get('test-key')
+
+        self.assertEqual(result, 'test-value')
+        self.mock_request.assert_called_once_with('GET', self.client._url_get + 'test-key')
+
+
+class TestClientCache(unittest.TestCase):
+    """Test cases for the client-side read cache."""
+
+    def _make_client(self, **kwargs):
+        from kachy.config import KachyConfig
+        from kachy.client import KachyClient
+
+        client = KachyClient(KachyConfig(access_key='test-secret', **kwargs))
+        # KachyClient is slotted, so patch at class level
+        patcher = patch.object(KachyClient, '_make_request')
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        return client
+
+    def test_cache_disabled_by_default(self):
+        """Test that every read hits the API when the cache is off."""
+        client = self._make_client()
+        self.mock_request.return_value = {"value": "test-value"}
+
+        client.get('test-key')
+        client.get('test-key')
+
+        self.assertEqual(self.mock_request.call_count, 2)
+
+    def test_repeated_reads_served_from_cache(self):
+        """Test that a burst of reads makes a single request."""
+        client = self._make_client(client_cache_size=16)
+        self.mock_request.return_value = {"value": "test-value"}
+
+        results = [client.get('test-key') for _ in range(5)]
+
+        self.assertEqual(results, ['test-value'] * 5)
+        self.assertEqual(self.mock_request.call_count, 1)
+
+    def test_write_invalidates_cached_read(self):
+        """Test that set() drops the cached value for the written key."""
+        client = self._make_client(client_cache_size=16)
+        self.mock_request.return_value = {"value": "old-value"}
+
+        self.assertEqual(client.get('test-key'), 'old-value')
+
+        self.mock_request.return_value = {"success": True}
+        client.set('test-key', 'new-value')
+
+        self.mock_request.return_value = {"value": "new-value"}
+        self.assertEqual(client.get('test-key'), 'new-value')
+
+    def test_cache_expires_after_ttl(self):
+        """Test that cached reads go stale after client_cache_ttl."""
+        client = self._make_client(client_cache_size=16, client_cache_ttl=0.0)
+        self.mock_request.return_value = {"value": "test-value"}
+
+        client.get('test-key')
+        client.get('test-key')
+
+        self.assertEqual(self.mock_request.call_count, 2)
+
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+
+@unittest.skipUnless(HAS_HTTPX, "httpx not installed")
+class TestAsyncKachyClient(unittest.TestCase):
+    """Test cases for the async Kachy client."""
+
+    def _run(self, coro):
+        import asyncio
+        return asyncio.run(coro)
+
+    def _make_client(self):
+        from kachy.config import KachyConfig
+        from kachy.aio import AsyncKachyClient
+
+        return AsyncKachyClient(KachyConfig(access_key='test-secret'))
+
+    def test_async_get(self):
+        """Test async get operation."""
+        async def scenario():
+            async with self._make_client() as client:
+                async def fake_request(method, url, data=None):
+                    return {"value": "test-value"}
+                client._make_request = fake_request
+                return await client.get('test-key')
+
+        self.assertEqual(self._run(scenario()), 'test-value')
+
+    def test_async_gather(self):
+        """Test overlapping multiple requests with asyncio.gather."""
+        import asyncio
+
+        async def scenario():
+            async with self._make_client() as client:
+                async def fake_request(method, url, data=None):
+                    return {"value": url.rsplit('/', 1)[-1]}
+                client._make_request = fake_request
+                return await asyncio.gather(client.get('k1'), client.get('k2'))
+
+        self.assertEqual(self._run(scenario()), ['k1', 'k2'])
+
+
 if __name__ == '__main__':
     unittest.main()